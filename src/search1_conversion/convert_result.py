@@ -1,7 +1,9 @@
+from types import MappingProxyType
+
 from src.utils.config import config
 from src.utils.formatting import iso8601_to_epoch_ms
 from src.utils.user_profiles import get_user_profiles
-from src.utils.workspace import get_workspace_info
+from src.utils.workspace import get_workspace_infos, WorkspaceInfo
 from src.exceptions import NoAccessGroupError, NoUserProfileError
 
 # TODO: The structure of the ES docs and of the API's result
@@ -9,7 +11,7 @@ from src.exceptions import NoAccessGroupError, NoUserProfileError
 # reference here.
 
 # Mappings from search2 document fields to search1 fields.
-_GLOBAL_DOC_KEY_MAPPING = {
+_GLOBAL_DOC_KEY_MAPPING = MappingProxyType({
     'obj_name': 'object_name',
     'access_group': 'workspace_id',
     'obj_id': 'object_id',
@@ -18,35 +20,44 @@ _GLOBAL_DOC_KEY_MAPPING = {
     'obj_type_name': 'workspace_type_name',
     'obj_type_version': 'workspace_type_version',
     'timestamp': 'modified_at'
-}
+})
+# The same mapping as (search2 key, search1 key) pairs, for iterating per hit.
+_GLOBAL_DOC_KEY_MAPPING_ITEMS = tuple(_GLOBAL_DOC_KEY_MAPPING.items())
 
 # These keys are copied over literally without renaming
 # keys or transformation
-_GLOBAL_DOC_KEY_COPYING = [
+_GLOBAL_DOC_KEY_COPYING = (
     'creator',
     'copied'
-]
+)
 
 # These keys are copied from the result "hit", not "hit.doc" as
 # above.
-_GLOBAL_HIT_KEY_COPYING = [
-    'id'
-]
+_GLOBAL_HIT_KEY_COPYING = (
+    'id',
+)
 
 # These keys are to be neither mapped nor copied, but when copying the rest of the
 # doc fields into the data field, should be excluded, or omitted.
-_GLOBAL_DOC_KEY_EXCLUSION = [
+_GLOBAL_DOC_KEY_EXCLUSION = (
     'is_public',
     'shared_users',
     'tags',
     'index_runner_ver'
-]
+)
 
 # Similar to excluded fields, these fields are transformed and copied in code below
 # (see the "# Transforms" comment) and should be ignored when copying into the data field.
-_GLOBAL_DOC_KEY_TRANSFORMS = [
-    'creation_date'
-]
+_GLOBAL_DOC_KEY_TRANSFORMS = (
+    'creation_date',
+)
+
+# All of the doc keys above, none of which are copied into the data field.
+_GLOBAL_DOC_KEYS = frozenset(_GLOBAL_DOC_KEY_MAPPING).union(
+    _GLOBAL_DOC_KEY_COPYING,
+    _GLOBAL_DOC_KEY_EXCLUSION,
+    _GLOBAL_DOC_KEY_TRANSFORMS
+)
 
 
 def search_objects(params: dict, results: dict, ctx: dict):
@@ -55,16 +66,14 @@ def search_objects(params: dict, results: dict, ctx: dict):
     "search_objects" method
     """
     post_processing = _get_post_processing(params)
-    objects = _get_object_data_from_search_results(results, post_processing)
     ret = {
         'pagination': params.get('pagination', {}),
         'sorting_rules': params.get('sorting_rules', []),
         'total': results['count'],
         'search_time': results['search_time'],
-        'objects': objects,
+        'objects': _get_object_data_from_search_results(results, post_processing),
     }
     _add_access_group_info(ret, results, ctx, post_processing)
-    _add_objects_and_info(ret, results, ctx, post_processing)
 
     return ret
 
@@ -77,12 +86,7 @@ def search_types(results: dict):
     # Convert the ES result format into the API format
     search_time = results['search_time']
     type_counts = results['aggregations']['type_count']['counts']
-    type_to_count = {}  # type: dict
-
-    for type_count in type_counts:
-        key = type_count['key']
-        count = type_count['count']
-        type_to_count[key] = count
+    type_to_count = {type_count['key']: type_count['count'] for type_count in type_counts}
     return {
         'type_to_count': type_to_count,
         'search_time': int(search_time)
@@ -97,9 +101,9 @@ def get_objects(params, results, ctx):
     post_processing = _get_post_processing(params)
     ret = {
         'search_time': results['search_time'],
+        'objects': _get_object_data_from_search_results(results, post_processing),
     }
     _add_access_group_info(ret, results, ctx, post_processing)
-    _add_objects_and_info(ret, results, ctx, post_processing)
     return ret
 
 
@@ -116,20 +120,6 @@ def _get_post_processing(params: dict) -> dict:
     return pp
 
 
-def _add_objects_and_info(ret: dict, search_results: dict, ctx: dict, post_processing: dict):
-    """
-    Populate the fields for `objects`.
-
-    Args:
-        ret: final method result object (mutated)
-        search_results: return value from es_client.query.search
-        ctx: RPC context object (contains auth token)
-        post_processing: some query options pulled from the RPC method params
-    """
-    objects = _get_object_data_from_search_results(search_results, post_processing)
-    ret['objects'] = objects
-
-
 def _add_access_group_info(ret: dict, search_results: dict, ctx: dict, post_processing: dict):
     """
     Populate the fields for `access_group_narrative_info` and/or
@@ -145,76 +135,72 @@ def _add_access_group_info(ret: dict, search_results: dict, ctx: dict, post_proc
     fetch_narratives = post_processing.get('add_narrative_info') == 1
     fetch_ws_infos = post_processing.get('add_access_group_info') == 1
     if fetch_narratives or fetch_ws_infos:
-        (ws_infos, narrative_infos) = _fetch_narrative_info(search_results, ctx)
+        ws_infos = _fetch_workspace_infos(search_results, ctx)
+        # Owner profiles are only needed for the narrative info
         if fetch_narratives:
-            ret['access_group_narrative_info'] = narrative_infos
+            ret['access_group_narrative_info'] = _fetch_narrative_infos(ws_infos, ctx)
         if fetch_ws_infos:
             ret['access_groups_info'] = ws_infos
 
 
-def _fetch_narrative_info(es_result, ctx):
+def _fetch_workspace_infos(es_result, ctx):
     """
-    Returns a to mappings of workspaces, each keyed on the workspace id:
-    - a subset of workspace info as returned by the workspace:
+    Returns a mapping of the workspaces in the search results, keyed on the
+    workspace id, to the workspace info as returned by the workspace:
       (id, name, owner, save_date, max_objid, user_perm, global_perm,
        lockstat, metadata)
-    - a subset of narrative info for workspaces which are narratives, a tuple
-      of selected values:
-      (narrative title, object id, workspace modification timestamp,
-       owner username, owner realname)
-
-    The reason for the duplication is historical, not intentional design.
-    One day we will rectify this.
-
-    (id, name, owner, save_date, max_objid, user_perm, global_perm, lockstat, metadata)
     """
-    hit_docs = [hit['doc'] for hit in es_result['hits']]
-    workspace_ids = set()
     ws_infos = {}
-    owners = set()
 
     # Get workspace info for all unique workspaces in the search
     # results
-    for hit_doc in hit_docs:
-        if 'access_group' not in hit_doc:
-            raise NoAccessGroupError()
-        workspace_id = hit_doc['access_group']
-        workspace_ids.add(workspace_id)
+    try:
+        workspace_ids = {hit['doc']['access_group'] for hit in es_result['hits']}
+    except KeyError:
+        raise NoAccessGroupError()
 
     if len(workspace_ids) == 0:
-        return {}, {}
+        return {}
 
-    for workspace_id in workspace_ids:
-        workspace_info = get_workspace_info(workspace_id, ctx['auth'])
+    workspace_infos = get_workspace_infos(workspace_ids, ctx['auth'])
+    for workspace_id, workspace_info in workspace_infos.items():
         if len(workspace_info) > 2:
-            owners.add(workspace_info[2])
             ws_infos[str(workspace_id)] = workspace_info
+    return ws_infos
+
+
+def _fetch_narrative_infos(ws_infos, ctx):
+    """
+    Given the result of _fetch_workspace_infos, returns a mapping of the
+    workspaces which are narratives, keyed on the workspace id, to a tuple of
+    selected values:
+      (narrative title, object id, workspace modification timestamp,
+       owner username, owner realname)
+
+    The duplication with the workspace info is historical, not intentional
+    design. One day we will rectify this.
+    """
+    workspaces = [WorkspaceInfo(*ws_info) for ws_info in ws_infos.values()]
 
     # Get profile for all owners in the search results
-    owner_list = list(owners)
+    owner_list = list({workspace.owner for workspace in workspaces})
     user_profiles = get_user_profiles(owner_list, ctx['auth'])
-    user_profile_map = {}
-    for index, profile in enumerate(user_profiles):
-        if profile is None:
-            raise NoUserProfileError(owner_list[index])
-        username = profile['user']['username']
-        user_profile_map[username] = profile
+    if None in user_profiles:
+        raise NoUserProfileError(owner_list[user_profiles.index(None)])
+    real_names = {profile['user']['username']: profile['user']['realname'] for profile in user_profiles}
 
     # Get all the source document objects for each narrative result
     narr_infos = {}
-    for ws_info in ws_infos.values():
-        [workspace_id, _, owner, moddate, _, _, _, _, ws_metadata] = ws_info
-        user_profile = user_profile_map.get(owner)
-        real_name = user_profile['user']['realname']
-        if 'narrative' in ws_metadata:
-            narr_infos[str(workspace_id)] = [
-                ws_metadata.get('narrative_nice_name', ''),
-                int(ws_metadata.get('narrative')),
-                iso8601_to_epoch_ms(moddate),
-                owner,
-                real_name
+    for workspace in workspaces:
+        if 'narrative' in workspace.metadata:
+            narr_infos[str(workspace.id)] = [
+                workspace.metadata.get('narrative_nice_name', ''),
+                int(workspace.metadata['narrative']),
+                iso8601_to_epoch_ms(workspace.moddate),
+                workspace.owner,
+                real_names[workspace.owner]
             ]
-    return ws_infos, narr_infos
+    return narr_infos
 
 
 def _get_object_data_from_search_results(search_results, post_processing):
@@ -226,86 +212,98 @@ def _get_object_data_from_search_results(search_results, post_processing):
     # TODO post_processing/skip_info,skip_keys,skip_data -- look at results in current api
     # TODO post_processing/ids_only -- look at results in current api
 
-    object_data = []  # type: list
-    # Keys found in every ws object
-    for hit in search_results['hits']:
-        doc = hit['doc']
-        obj: dict = {}
-
-        # Copy fields from the "hit" to the result "object".
-        for key in _GLOBAL_HIT_KEY_COPYING:
-            obj[key] = hit.get(key)
-
-        # Simple key mapping from the doc to the object.
-        # The mapping transforms the raw keys from the ES result into
-        # friendlier keys expected by the API.
-        # Defined at top of file.
-        global_doc_keys = []
-        for (search2_key, search1_key) in _GLOBAL_DOC_KEY_MAPPING.items():
-            global_doc_keys.append(search2_key)
-            obj[search1_key] = doc.get(search2_key)
-
-        #  Even simpler key mapping - no key substitution
-        for key in _GLOBAL_DOC_KEY_COPYING:
-            global_doc_keys.append(key)
-            obj[key] = doc.get(key)
-
-        # Transforms
-        obj['created_at'] = iso8601_to_epoch_ms((doc['creation_date']))
-
-        # The index name from the external pov is unqualified and
-        # unversioned; it is equivalent to the index alias, and
-        # symmetric with any parameters which limit searches by
-        # index.
-        # The form of object indexes is:
-        # NAMESPACE.INDEXNAME_VERSION
-        # (why different separators for prefix and suffix?)
-        # e.g. search2.genome_2
-        # We are interested in the INDEXNAME and VERSION,
-        # although there is no need for clients to know the version
-        # it may be useful for diagnostics.
-        idx_pieces = hit['index'].split(config['suffix_delimiter'])
-        idx_name = idx_pieces[0]
-
-        # TODO: we should not default to 0, but rather raise an
-        # error. All indexes involved should be namespaced.
-        idx_ver = int(idx_pieces[1] or 0) if len(idx_pieces) == 2 else 0
-        obj['index_name'] = idx_name
-        obj['index_version'] = idx_ver
-
-        # Funny Business
-        # Always set object_name as a string type
-        # TODO: how can this ever be missing? It is simply impossible, every
-        # object has a name and a type.
-        obj['object_name'] = obj.get('object_name') or ''
-        obj['workspace_type_name'] = obj.get('workspace_type_name') or ''
-
-        # The nested 'data' is all object-specific, so exclude all global keys
-        # The indexed doc mixes global keys and index-specific ones.
-        # The search1 api separated them, so this transformation respects that.
-        obj_data = {key: doc[key] for key in doc if key not in global_doc_keys
-                    and key not in _GLOBAL_DOC_KEY_EXCLUSION
-                    and key not in _GLOBAL_DOC_KEY_TRANSFORMS}
-
-        if post_processing.get('skip_data') != 1:
-            obj['data'] = obj_data
-
-        # Highlights are mappings of key to a formatted string
-        # derived from the field with "hit" terms highlighted with
-        # html.
-        # These fields may be any field in the indexed doc, which
-        # mixes global and index-specific fields.
-        # We need to transform the keys, if the GLOBAL_KEY_MAPPING
-        # so deems; otherwise we use the keys directly.
-        # TODO: improvements needed here; not all search terms are highlighted
-        # as a result of this transform, which results in a confusing message
-        # on the front end.
-        if post_processing.get('include_highlight') == 1:
-            highlight = hit.get('highlight', {})
-            transformed_highlight = {}
-            for key, value in highlight.items():
-                transformed_highlight[_GLOBAL_DOC_KEY_MAPPING.get(key, key)] = value
-            obj['highlight'] = transformed_highlight
-
-        object_data.append(obj)
-    return object_data
+    # Read the options once, rather than for every hit
+    include_highlight = post_processing.get('include_highlight') == 1
+    skip_data = post_processing.get('skip_data') == 1
+    suffix_delimiter = config['suffix_delimiter']
+    # A page of hits only spans a handful of distinct indexes, so parse each
+    # index name once.
+    indexes = {hit['index'] for hit in search_results['hits']}
+    index_infos = {index: _parse_index_name(index, suffix_delimiter) for index in indexes}
+    return [_convert_hit(hit, include_highlight, skip_data, index_infos)
+            for hit in search_results['hits']]
+
+
+def _parse_index_name(index: str, suffix_delimiter: str) -> tuple:
+    """
+    Split a search result's index into its unversioned name and version.
+
+    The index name from the external pov is unqualified and
+    unversioned; it is equivalent to the index alias, and
+    symmetric with any parameters which limit searches by
+    index.
+    The form of object indexes is:
+    NAMESPACE.INDEXNAME_VERSION
+    (why different separators for prefix and suffix?)
+    e.g. search2.genome_2
+    We are interested in the INDEXNAME and VERSION,
+    although there is no need for clients to know the version
+    it may be useful for diagnostics.
+    """
+    idx_pieces = index.split(suffix_delimiter)
+    idx_name = idx_pieces[0]
+
+    # TODO: we should not default to 0, but rather raise an
+    # error. All indexes involved should be namespaced.
+    idx_ver = int(idx_pieces[1] or 0) if len(idx_pieces) == 2 else 0
+    return (idx_name, idx_ver)
+
+
+def _convert_hit(hit: dict, include_highlight: bool, skip_data: bool, index_infos: dict) -> dict:
+    """
+    Convert a single search result hit into an ObjectData.
+    `index_infos` maps each index in the search results to its name and version.
+    """
+    doc = hit['doc']
+    obj: dict = {}
+
+    # Copy fields from the "hit" to the result "object".
+    for key in _GLOBAL_HIT_KEY_COPYING:
+        obj[key] = hit.get(key)
+
+    # Simple key mapping from the doc to the object.
+    # The mapping transforms the raw keys from the ES result into
+    # friendlier keys expected by the API.
+    # Defined at top of file.
+    for (search2_key, search1_key) in _GLOBAL_DOC_KEY_MAPPING_ITEMS:
+        obj[search1_key] = doc.get(search2_key)
+
+    #  Even simpler key mapping - no key substitution
+    for key in _GLOBAL_DOC_KEY_COPYING:
+        obj[key] = doc.get(key)
+
+    # Transforms
+    obj['created_at'] = iso8601_to_epoch_ms((doc['creation_date']))
+
+    (idx_name, idx_ver) = index_infos[hit['index']]
+    obj['index_name'] = idx_name
+    obj['index_version'] = idx_ver
+
+    # Funny Business
+    # Always set object_name as a string type
+    # TODO: how can this ever be missing? It is simply impossible, every
+    # object has a name and a type.
+    obj['object_name'] = obj.get('object_name') or ''
+    obj['workspace_type_name'] = obj.get('workspace_type_name') or ''
+
+    # The nested 'data' is all object-specific, so exclude all global keys
+    # The indexed doc mixes global keys and index-specific ones.
+    # The search1 api separated them, so this transformation respects that.
+    if not skip_data:
+        obj['data'] = {key: value for (key, value) in doc.items() if key not in _GLOBAL_DOC_KEYS}
+
+    # Highlights are mappings of key to a formatted string
+    # derived from the field with "hit" terms highlighted with
+    # html.
+    # These fields may be any field in the indexed doc, which
+    # mixes global and index-specific fields.
+    # We need to transform the keys, if the GLOBAL_KEY_MAPPING
+    # so deems; otherwise we use the keys directly.
+    # TODO: improvements needed here; not all search terms are highlighted
+    # as a result of this transform, which results in a confusing message
+    # on the front end.
+    if include_highlight:
+        highlight = hit.get('highlight', {})
+        obj['highlight'] = {_GLOBAL_DOC_KEY_MAPPING.get(key, key): value for (key, value) in highlight.items()}
+
+    return obj
@@ -0,0 +1,61 @@
+"""
+In-memory caching of responses from other KBase services
+"""
+import hashlib
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Optional
+
+
+class TTLCache:
+    """
+    A least-recently-used cache in which each entry expires `ttl` seconds after
+    it was set. Hits and misses are tallied in `stats`.
+    This is safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = Counter()  # type: Counter
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the unexpired value for `key`, or `default`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.stats['misses'] += 1
+                return default
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[1]
+
+    def set(self, key, value):
+        """Store `value` under `key`, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset the stats."""
+        with self._lock:
+            self._entries.clear()
+            self.stats.clear()
+
+
+def token_key(token: Optional[str]) -> Optional[str]:
+    """
+    Derive a cache key component from an auth token, so that cached results
+    are partitioned per user without keeping the token itself around.
+    """
+    if token is None:
+        return None
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
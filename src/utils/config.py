@@ -43,6 +43,8 @@ def init_config():
         'workspace_url': ws_url,
         'user_profile_url': user_profile_url,
         'workers': int(os.environ.get('WORKERS', 8)),
+        'cache_max_size': int(os.environ.get('CACHE_MAX_SIZE', 10000)),
+        'cache_ttl': int(os.environ.get('CACHE_TTL', 60)),
         'app_version': app_version,
     }
 
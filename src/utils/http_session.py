@@ -0,0 +1,23 @@
+"""
+Shared HTTP session for requests to other KBase services
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept open per host; also bounds our concurrent requests to a service
+MAX_CONNECTIONS = 32
+
+
+def init_session():
+    """
+    Initialize a session which reuses connections across requests, rather than
+    opening a new connection for every call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONNECTIONS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+session = init_session()
@@ -1,18 +1,35 @@
 import json
-import requests
 
+from src.utils.cache import TTLCache, token_key
 from src.utils.config import config
+from src.utils.http_session import session
 from src.exceptions import UserProfileError
 
+# User profiles keyed on (username, auth token key)
+user_profile_cache = TTLCache(maxsize=config['cache_max_size'], ttl=config['cache_ttl'])
+
 
 def get_user_profiles(usernames: list, auth_token=None):
     """
-    Get a list of workspace IDs that the given username is allowed to access in
-    the workspace.
+    Get the user profile for each of the given usernames, in the same order.
+    A profile is None if the user has no profile.
+    Only profiles which are not already cached are requested.
     """
+    token = token_key(auth_token)
+    profiles = {username: user_profile_cache.get((username, token)) for username in usernames}
+    missing = [username for (username, profile) in profiles.items() if profile is None]
+    if len(missing) > 0:
+        fetched = _fetch_user_profiles(missing, auth_token)
+        for (username, profile) in zip(missing, fetched):
+            profiles[username] = profile
+            if profile is not None:
+                user_profile_cache.set((username, token), profile)
+    return [profiles[username] for username in usernames]
+
+
+def _fetch_user_profiles(usernames: list, auth_token=None):
+    """Request the profiles for the given usernames from the user profile service."""
     url = config['user_profile_url']
-    # TODO session cache this
-    # Make a request to the workspace using the user's auth token to find their readable workspace IDs
     payload = {
         'method': 'UserProfile.get_user_profile',
         'version': '1.1',
@@ -21,7 +38,7 @@ def get_user_profiles(usernames: list, auth_token=None):
     headers = {}
     if auth_token is not None:
         headers['Authorization'] = auth_token
-    resp = requests.post(
+    resp = session.post(
         url=url,
         data=json.dumps(payload),
         headers=headers,
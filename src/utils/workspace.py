@@ -2,12 +2,32 @@
 Workspace user authentication: find workspaces the user can search
 """
 import json
-import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Optional
 
+from src.utils.cache import TTLCache, token_key
 from src.utils.config import config
+from src.utils.http_session import session, MAX_CONNECTIONS
 from src.exceptions import AuthError
 
+# Workspace infos keyed on (workspace id, auth token key)
+workspace_info_cache = TTLCache(maxsize=config['cache_max_size'], ttl=config['cache_ttl'])
+
+
+class WorkspaceInfo(NamedTuple):
+    """
+    Named fields for a workspace info tuple, as returned by get_workspace_info
+    """
+    id: int
+    name: str
+    owner: str
+    moddate: str
+    max_objid: int
+    user_perm: str
+    global_perm: str
+    lockstat: str
+    metadata: dict
+
 
 def ws_auth(auth_token, only_public=False, only_private=False):
     """
@@ -41,9 +61,29 @@ def get_workspace_info(workspace_id, auth_token=None):
     """
     Given a workspace id, return the associated workspace info
     """
-    # TODO session cache this
-    params = {'id': workspace_id}
-    return _req('get_workspace_info', params, auth_token)
+    cache_key = (workspace_id, token_key(auth_token))
+    info = workspace_info_cache.get(cache_key)
+    if info is None:
+        params = {'id': workspace_id}
+        info = _req('get_workspace_info', params, auth_token)
+        if info is not None:
+            workspace_info_cache.set(cache_key, info)
+    return info
+
+
+def get_workspace_infos(workspace_ids: Iterable, auth_token=None) -> dict:
+    """
+    Given a collection of workspace ids, return a mapping of each workspace id
+    to its workspace info.
+    The workspace has no bulk equivalent of get_workspace_info, so the
+    individual requests are issued concurrently.
+    """
+    workspace_ids = list(workspace_ids)
+    if len(workspace_ids) == 0:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_CONNECTIONS, len(workspace_ids))) as executor:
+        infos = executor.map(lambda ws_id: get_workspace_info(ws_id, auth_token), workspace_ids)
+        return dict(zip(workspace_ids, infos))
 
 
 def _req(method: str, params: dict, token: Optional[str]):
@@ -59,7 +99,7 @@ def _req(method: str, params: dict, token: Optional[str]):
     if token is not None:
         headers['Authorization'] = token
 
-    resp = requests.post(
+    resp = session.post(
         url=config['workspace_url'],
         headers=headers,
         data=json.dumps(payload),
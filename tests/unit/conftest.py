@@ -5,6 +5,8 @@ from tests.helpers.unit_setup import (
     stop_service
 )
 from tests.helpers import init_elasticsearch
+from src.utils.user_profiles import user_profile_cache
+from src.utils.workspace import workspace_info_cache
 
 # ES_URL = 'http://localhost:9200'
 APP_URL = 'http://localhost:5000'
@@ -16,3 +18,10 @@ def services():
     init_elasticsearch()
     yield {'app_url': APP_URL}
     stop_service()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Don't let cached service responses leak between tests."""
+    workspace_info_cache.clear()
+    user_profile_cache.clear()
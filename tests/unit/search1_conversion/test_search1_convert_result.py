@@ -69,28 +69,30 @@ class Search1ConversionTest(unittest.TestCase):
 
         self.assertEqual(final['type_to_count'], test_expected['type_to_count'])
 
-    def test_fetch_narrative_info_no_hits(self):
+    def test_fetch_workspace_infos_no_hits(self):
         results = {
             'hits': []
         }
         ctx = {}
-        result = convert_result._fetch_narrative_info(results, ctx)
-        assert len(result) == 2
-        assert result[0] == {}
-        assert result[1] == {}
+        result = convert_result._fetch_workspace_infos(results, ctx)
+        assert result == {}
+
+    def test_fetch_narrative_infos_no_workspaces(self):
+        result = convert_result._fetch_narrative_infos({}, {'auth': None})
+        assert result == {}
 
     # TODO: This condition should not occur in any object index!
-    def test_fetch_narrative_info_no_access_group(self):
+    def test_fetch_workspace_infos_no_access_group(self):
         results = {
             'hits': [{
                 'doc': {}
             }]
         }
         with self.assertRaises(NoAccessGroupError):
-            convert_result._fetch_narrative_info(results, {'auth': None})
+            convert_result._fetch_workspace_infos(results, {'auth': None})
 
     @responses.activate
-    def test_fetch_narrative_info_owner_has_profile(self):
+    def test_fetch_narrative_infos_owner_has_profile(self):
         responses.add_callback(responses.POST, config['workspace_url'],
                                callback=workspace_call)
 
@@ -105,14 +107,15 @@ class Search1ConversionTest(unittest.TestCase):
         ctx = {
             'auth': None
         }
-        result = convert_result._fetch_narrative_info(test_es_search_results, ctx)
-        self.assertEqual(len(result), 2)
+        ws_infos = convert_result._fetch_workspace_infos(test_es_search_results, ctx)
+        self.assertEqual(ws_infos, test_expected['access_groups_info'])
+        result = convert_result._fetch_narrative_infos(ws_infos, ctx)
 
         expected_result = test_expected['access_group_narrative_info']
-        self.assertEqual(result[1], expected_result)
+        self.assertEqual(result, expected_result)
 
     @responses.activate
-    def test_fetch_narrative_info_owner_has_no_profile(self):
+    def test_fetch_narrative_infos_owner_has_no_profile(self):
         responses.add_callback(responses.POST, config['workspace_url'],
                                callback=workspace_call)
 
@@ -128,8 +131,9 @@ class Search1ConversionTest(unittest.TestCase):
         meta = {
             'auth': None
         }
+        ws_infos = convert_result._fetch_workspace_infos(results, meta)
         with self.assertRaises(NoUserProfileError) as e:
-            convert_result._fetch_narrative_info(results, meta)
+            convert_result._fetch_narrative_infos(ws_infos, meta)
         self.assertEqual(e.exception.message,
                          'A user profile could not be found for "kbaseuitestx"')
 
@@ -151,3 +155,43 @@ class Search1ConversionTest(unittest.TestCase):
             test_es_search_results,
             post_processing)
         self.assertEqual(converted, test_expected['objects'])
+
+    def test_get_object_data_from_search_results_skip_data(self):
+        _found, test_es_search_results = get_data(
+            'elasticsearch/legacy/search_objects/case-01/result.json')
+        _found, test_expected = get_data(
+            'SearchAPI/legacy/search_objects/case-01/result.json')
+
+        post_processing = {'skip_data': 1, 'include_highlight': 0}
+        converted = convert_result._get_object_data_from_search_results(
+            test_es_search_results,
+            post_processing)
+        expected = [
+            {key: value for (key, value) in obj.items() if key not in ('data', 'highlight')}
+            for obj in test_expected['objects']
+        ]
+        self.assertEqual(converted, expected)
+
+    def test_parse_index_name(self):
+        self.assertEqual(convert_result._parse_index_name('search2.genome_2', '_'), ('search2.genome', 2))
+        self.assertEqual(convert_result._parse_index_name('search2.genome_', '_'), ('search2.genome', 0))
+        self.assertEqual(convert_result._parse_index_name('search2.genome', '_'), ('search2.genome', 0))
+
+    @responses.activate
+    def test_search_objects_access_group_info_only(self):
+        # The user profile service is not mocked, so any call to it fails.
+        responses.add_callback(responses.POST, config['workspace_url'],
+                               callback=workspace_call)
+
+        _found, test_params = get_data(
+            'SearchAPI/legacy/search_objects/case-01/params.json')
+        _found, test_es_search_results = get_data(
+            'elasticsearch/legacy/search_objects/case-01/result.json')
+        _found, test_expected = get_data(
+            'SearchAPI/legacy/search_objects/case-01/result.json')
+
+        test_params['post_processing']['add_narrative_info'] = 0
+        test_params['post_processing']['add_access_group_info'] = 1
+        final = convert_result.search_objects(test_params, test_es_search_results, {'auth': None})
+        self.assertEqual(final['access_groups_info'], test_expected['access_groups_info'])
+        self.assertNotIn('access_group_narrative_info', final)
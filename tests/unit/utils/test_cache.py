@@ -0,0 +1,46 @@
+import time
+
+from src.utils.cache import TTLCache, token_key
+
+
+def test_ttl_cache_get_set():
+    cache = TTLCache(maxsize=10, ttl=60)
+    assert cache.get('x') is None
+    assert cache.get('x', 'default') == 'default'
+    cache.set('x', 1)
+    assert cache.get('x') == 1
+    assert cache.stats == {'hits': 1, 'misses': 2}
+
+
+def test_ttl_cache_expiry():
+    cache = TTLCache(maxsize=10, ttl=0.01)
+    cache.set('x', 1)
+    time.sleep(0.02)
+    assert cache.get('x') is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('x', 1)
+    cache.set('y', 2)
+    cache.get('x')
+    cache.set('z', 3)
+    assert cache.get('y') is None
+    assert cache.get('x') == 1
+    assert cache.get('z') == 3
+
+
+def test_ttl_cache_clear():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set('x', 1)
+    cache.get('x')
+    cache.clear()
+    assert cache.get('x') is None
+    assert cache.stats == {'misses': 1}
+
+
+def test_token_key():
+    assert token_key(None) is None
+    assert token_key('abc') == token_key('abc')
+    assert token_key('abc') != token_key('abd')
+    assert 'abc' not in token_key('abc')
@@ -9,7 +9,20 @@ class UtilsFormattingTest(unittest.TestCase):
             {
                 'input': '1970-01-01T00:00:00Z',
                 'expected': 0
+            },
+            {
+                'input': '2020-06-06T03:49:55+0000',
+                'expected': 1591415395000
+            },
+            {
+                'input': '2020-06-06T05:49:55+0200',
+                'expected': 1591415395000
             }
         ]
         for case in cases:
             self.assertEqual(iso8601_to_epoch_ms(case['input']), case['expected'])
+
+    def test_iso8601_to_epoch_ms_invalid(self):
+        for time_string in ['2020-06-06', '2020-06-06T03:49:5x+0000', '2020-13-06T03:49:55Z']:
+            with self.assertRaises(ValueError):
+                iso8601_to_epoch_ms(time_string)
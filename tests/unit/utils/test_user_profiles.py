@@ -35,6 +35,26 @@ def test_get_user_profiles_noauth():
     assert res == mock_resp['result'][0]
 
 
+@responses.activate
+def test_get_user_profiles_cached():
+    responses.add(responses.POST, config['user_profile_url'],
+                  json=mock_resp, status=200)
+    get_user_profiles(['username'], 'x')
+    res = get_user_profiles(['username'], 'x')
+    assert res == mock_resp['result'][0]
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_user_profiles_missing_not_cached():
+    resp = {"version": "1.1", "result": [[None]]}
+    responses.add(responses.POST, config['user_profile_url'],
+                  json=resp, status=200)
+    assert get_user_profiles(['nobody'], 'x') == [None]
+    assert get_user_profiles(['nobody'], 'x') == [None]
+    assert len(responses.calls) == 2
+
+
 @responses.activate
 def test_get_user_profiles_invalid():
     responses.add(responses.POST, config['user_profile_url'], status=400)
@@ -3,7 +3,7 @@ import responses
 import json
 
 from src.utils.config import config
-from src.utils.workspace import ws_auth, get_workspace_info
+from src.utils.workspace import ws_auth, get_workspace_info, get_workspace_infos, WorkspaceInfo
 from src.exceptions import ResponseError
 
 # TODO: All tests should be rewritten to use an explicit service call matcher
@@ -253,6 +253,21 @@ def test_get_workspace_info_public():
     assert result == mock_ws_info['result'][0]
 
 
+@responses.activate
+def test_get_workspace_info_cached():
+    responses.add(responses.POST,
+                  config['workspace_url'],
+                  json=mock_ws_info,
+                  status=200)
+    get_workspace_info(1, 'token')
+    result = get_workspace_info(1, 'token')
+    assert result == mock_ws_info['result'][0]
+    assert len(responses.calls) == 1
+    # A different token must not share the cached result
+    get_workspace_info(1, 'other_token')
+    assert len(responses.calls) == 2
+
+
 @responses.activate
 def test_get_workspace_info_invalid():
     responses.add(responses.POST,
@@ -279,3 +294,40 @@ def test_get_workspace_info_invalid2():
     err = ctx.value
     assert err.jsonrpc_code == -32001
     assert len(err.message) > 0
+
+
+@responses.activate
+def test_get_workspace_infos_valid():
+    responses.add(responses.POST,
+                  config['workspace_url'],
+                  json=mock_ws_info,
+                  status=200)
+    result = get_workspace_infos([1, 2], 'token')
+    assert result == {
+        1: mock_ws_info['result'][0],
+        2: mock_ws_info['result'][0]
+    }
+    assert len(responses.calls) == 2
+
+
+def test_get_workspace_infos_empty():
+    assert get_workspace_infos([], 'token') == {}
+
+
+@responses.activate
+def test_get_workspace_infos_invalid():
+    responses.add(responses.POST,
+                  config['workspace_url'],
+                  status=500)
+    with pytest.raises(ResponseError) as ctx:
+        get_workspace_infos([1, 2], 'token')
+    err = ctx.value
+    assert err.jsonrpc_code == -32001
+
+
+def test_workspace_info_fields():
+    info = WorkspaceInfo(*mock_ws_info['result'][0])
+    assert info.id == 1
+    assert info.owner == 'username'
+    assert info.moddate == '2020-06-06T03:49:55+0000'
+    assert info.metadata == {'searchtags': 'refdata'}